@@ -0,0 +1,63 @@
+"""
+Shared Neo N3 constants for the helper scripts.
+
+Script hashes of the well-known accounts are derived from their addresses once
+at import time, so callers can use the raw bytes (or either hex form) without
+decoding anything per call.
+"""
+
+import functools
+import hashlib
+
+MASTER_ADDRESS = "NTmHjwiadq4g3VHpJ5FQigQcD4fF5m8TyX"
+TEE_ADDRESS = "NiNmXL8FjEUEs1nfX9uHFBNaenxDHJtmuB"
+
+_B58_ALPHABET = "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
+# Digit value of every byte (255 = not a base58 character), instead of a linear alphabet search
+_B58_MAP = bytes(_B58_ALPHABET.find(chr(i)) % 256 for i in range(256))
+# Nine digits fit in 64 bits (58**9 < 2**64), so the big accumulator is touched once per nine
+_B58_CHUNK = 9
+_POW58_CHUNK = 58 ** _B58_CHUNK
+_ADDRESS_VERSION = 0x35
+
+
+def decode_address(address):
+    """Decode a Neo N3 address into its 20-byte script hash (little-endian)."""
+    digits = address.encode("ascii")
+    value = 0
+    for start in range(0, len(digits), _B58_CHUNK):
+        chunk = digits[start:start + _B58_CHUNK]
+        chunk_value = 0
+        for byte in chunk:
+            digit = _B58_MAP[byte]
+            if digit == 255:
+                raise ValueError(f"Invalid base58 character in address: {address}")
+            chunk_value = chunk_value * 58 + digit
+        scale = _POW58_CHUNK if len(chunk) == _B58_CHUNK else 58 ** len(chunk)
+        value = value * scale + chunk_value
+
+    raw = value.to_bytes(25, "big")
+    payload, checksum = raw[:21], raw[21:]
+    if hashlib.sha256(hashlib.sha256(payload).digest()).digest()[:4] != checksum:
+        raise ValueError(f"Invalid address checksum: {address}")
+    if payload[0] != _ADDRESS_VERSION:
+        raise ValueError(f"Unsupported address version: {address}")
+
+    return payload[1:]
+
+
+@functools.cache
+def address_to_script_hash(address):
+    """Script hash of any address in its UInt160 string form (0x-prefixed, big-endian)."""
+    return "0x" + decode_address(address)[::-1].hex()
+
+
+# Raw script hashes, in the byte order they are serialized in transactions
+SCRIPT_HASHES = {address: decode_address(address) for address in (MASTER_ADDRESS, TEE_ADDRESS)}
+
+# Hex forms: little-endian (serialized) and big-endian (UInt160 string, e.g. RPC signers)
+SCRIPT_HASHES_HEX_LE = {address: script_hash.hex() for address, script_hash in SCRIPT_HASHES.items()}
+SCRIPT_HASHES_HEX_BE = {address: script_hash[::-1].hex() for address, script_hash in SCRIPT_HASHES.items()}
+
+for _address, _script_hash in SCRIPT_HASHES.items():
+    assert len(_script_hash) == 20, f"Script hash for {_address} must be 20 bytes"
@@ -0,0 +1,85 @@
+"""
+Shared HTTP and JSON-RPC helpers for the helper scripts.
+
+Every script reaches the Neo RPC node (and some the price source APIs) through a
+pooled, retrying session from create_session(), and encodes payloads with orjson
+when it is installed. Independent calls go out as one batch through rpc_batch().
+"""
+
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # optional; the standard library json module is used instead
+    orjson = None
+
+JSON_HEADERS = {"Content-Type": "application/json", "Accept": "application/json"}
+
+
+def create_session(total_retries=2, backoff_factor=0.2):
+    """Create an HTTP session that keeps connections alive and retries transient failures."""
+    # The scripts only send reads (RPC queries, invocation previews, price source GETs),
+    # so POSTs are as safe to retry as GETs; Retry-After is honored
+    retry = Retry(
+        total=total_retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=[429, 502, 503, 504],
+        allowed_methods=["GET", "POST"]
+    )
+    # One pool per host: the RPC node (or the TestNet seeds) plus any price sources
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retry)
+
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def dumps_json(payload):
+    """Serialize a payload to bytes (with orjson when it is installed)."""
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload).encode()
+
+
+def loads_json(data):
+    """Parse a JSON document from bytes or str (with orjson when it is installed)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def post_rpc(session, endpoint, payload, timeout=30):
+    """POST a JSON-RPC payload (single call or batch, or an already serialized body) and parse the reply."""
+    body = payload if isinstance(payload, bytes) else dumps_json(payload)
+    response = session.post(endpoint, data=body, headers=JSON_HEADERS, timeout=timeout)
+    return loads_json(response.content)
+
+
+def rpc_batch(send, calls):
+    """Send (method, params) pairs as one JSON-RPC batch and return the replies in call order.
+
+    send(payload) POSTs a single call or a batch and returns the parsed reply. A call the
+    node left out of its reply gets an error reply in its place, and if the node rejects
+    batches outright the calls are sent one per request, concurrently.
+    """
+    if not calls:
+        return []
+
+    batch = [
+        {"jsonrpc": "2.0", "method": method, "params": params, "id": i}
+        for i, (method, params) in enumerate(calls)
+    ]
+
+    replies = send(batch)
+    if not isinstance(replies, list):
+        with ThreadPoolExecutor(max_workers=len(batch)) as executor:
+            return list(executor.map(send, batch))
+
+    by_id = {reply.get("id"): reply for reply in replies}
+    return [by_id.get(i, {"error": {"message": "No reply in batch"}}) for i in range(len(calls))]
@@ -3,15 +3,11 @@
 Convert Neo addresses to script hashes for neo-cli
 """
 
+from _neo_constants import SCRIPT_HASHES_HEX_BE
+
 def address_to_scripthash(address):
     """Convert Neo address to script hash (without base58 dependency)"""
-    # Manual conversion for known addresses
-    address_map = {
-        "NTmHjwiadq4g3VHpJ5FQigQcD4fF5m8TyX": "285f1b5a0ae39889635da4df5a58dc4e2f1f163f",
-        "NiNmXL8FjEUEs1nfX9uHFBNaenxDHJtmuB": "936b3e5e7c0e9fc87f8cc2e1698ce62d6cb951b8"
-    }
-    
-    return address_map.get(address)
+    return SCRIPT_HASHES_HEX_BE.get(address)
 
 def show_commands():
     """Show corrected neo-cli commands"""
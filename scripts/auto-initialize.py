@@ -4,18 +4,21 @@ Auto-initialization script for GitHub Actions
 Checks if contract is initialized and initializes if needed
 """
 
-import requests
 import json
 import subprocess
 import sys
 import os
 
+from _rpc import create_session, post_rpc
+
 # Configuration (overridable via environment)
 RPC_ENDPOINT = os.environ.get("NEO_RPC_URL", "http://seed1t5.neo.org:20332")
 CONTRACT_HASH = os.environ.get("ORACLE_CONTRACT_HASH", "0x7b75a38c592af6b39d73d0ff971b125b5a55ad0d")
 MASTER_ADDRESS = os.environ.get("MASTER_ACCOUNT_ADDRESS", "NTmHjwiadq4g3VHpJ5FQigQcD4fF5m8TyX")
 TEE_ADDRESS = os.environ.get("NEO_TEE_ACCOUNT_ADDRESS", "NiNmXL8FjEUEs1nfX9uHFBNaenxDHJtmuB")
 
+SESSION = create_session()
+
 def rpc_call(method, params=None):
     """Make RPC call"""
     payload = {
@@ -26,8 +29,7 @@ def rpc_call(method, params=None):
     }
     
     try:
-        response = requests.post(RPC_ENDPOINT, json=payload, timeout=10)
-        return response.json()
+        return post_rpc(SESSION, RPC_ENDPOINT, payload, timeout=10)
     except Exception as e:
         print(f"❌ RPC error: {e}")
         return None
@@ -4,20 +4,24 @@ Check contract initialization status via RPC
 """
 
 import json
-import requests
-import base58
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+
+from _neo_constants import SCRIPT_HASHES_HEX_BE
+from _rpc import create_session, post_rpc
 
 # Configuration
 RPC_ENDPOINT = "http://seed1t5.neo.org:20332"
 CONTRACT_HASH = "0x7b75a38c592af6b39d73d0ff971b125b5a55ad0d"
 MASTER_ACCOUNT = "NTmHjwiadq4g3VHpJ5FQigQcD4fF5m8TyX"
 TEE_ACCOUNT = "NiNmXL8FjEUEs1nfX9uHFBNaenxDHJtmuB"
+PRICE_SYMBOLS = ["BTCUSDT", "ETHUSDT", "NEOUSDT"]
+
+# Hash160 parameters take the big-endian UInt160 form; resolved once at import
+TEE_SCRIPT_HASH = "0x" + SCRIPT_HASHES_HEX_BE[TEE_ACCOUNT]
 
-def address_to_script_hash(address):
-    """Convert Neo address to script hash"""
-    decoded = base58.b58decode(address)
-    script_hash = decoded[1:21]
-    return script_hash.hex()
+# One keep-alive session shared by every call (including the concurrent ones)
+SESSION = create_session()
 
 def invoke_function(method, params=[]):
     """Invoke a contract function via RPC"""
@@ -32,8 +36,7 @@ def invoke_function(method, params=[]):
         "id": 1
     }
     
-    response = requests.post(RPC_ENDPOINT, json=payload)
-    return response.json()
+    return post_rpc(SESSION, RPC_ENDPOINT, payload)
 
 def check_initialization():
     """Check if contract is initialized"""
@@ -61,8 +64,14 @@ def check_oracle_setup():
     """Check oracle configuration"""
     print("\n🔍 Checking oracle configuration...")
     
+    # The three reads are independent, so issue them concurrently
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        count_future = executor.submit(invoke_function, "getOracleCount")
+        is_oracle_future = executor.submit(invoke_function, "isOracle", [{"type": "Hash160", "value": TEE_SCRIPT_HASH}])
+        min_future = executor.submit(invoke_function, "getMinOracles")
+    
     # Check oracle count
-    result = invoke_function("getOracleCount")
+    result = count_future.result()
     if result.get("result", {}).get("state") == "HALT":
         stack = result.get("result", {}).get("stack", [])
         if stack:
@@ -70,10 +79,7 @@ def check_oracle_setup():
             print(f"📊 Oracle count: {count}")
     
     # Check if TEE is oracle
-    tee_script_hash = address_to_script_hash(TEE_ACCOUNT)
-    params = [{"type": "Hash160", "value": tee_script_hash}]
-    
-    result = invoke_function("isOracle", params)
+    result = is_oracle_future.result()
     if result.get("result", {}).get("state") == "HALT":
         stack = result.get("result", {}).get("stack", [])
         if stack:
@@ -81,7 +87,7 @@ def check_oracle_setup():
             print(f"🔑 TEE account ({TEE_ACCOUNT}) is oracle: {is_oracle}")
     
     # Check min oracles
-    result = invoke_function("getMinOracles")
+    result = min_future.result()
     if result.get("result", {}).get("state") == "HALT":
         stack = result.get("result", {}).get("stack", [])
         if stack:
@@ -92,23 +98,28 @@ def test_price_query():
     """Test price query functionality"""
     print("\n🔍 Testing price query...")
     
-    params = [{"type": "String", "value": "BTCUSDT"}]
-    result = invoke_function("getPrice", params)
+    # The queries are independent, so issue them concurrently
+    with ThreadPoolExecutor(max_workers=len(PRICE_SYMBOLS)) as executor:
+        results = list(executor.map(
+            lambda symbol: invoke_function("getPrice", [{"type": "String", "value": symbol}]),
+            PRICE_SYMBOLS
+        ))
     
-    if result.get("result", {}).get("state") == "HALT":
-        stack = result.get("result", {}).get("stack", [])
-        if stack and len(stack) > 0:
-            if stack[0].get("type") == "Integer":
-                price = int(stack[0].get("value", "0"))
-                if price > 0:
-                    print(f"💰 Current BTCUSDT price: {price}")
+    for symbol, result in zip(PRICE_SYMBOLS, results):
+        if result.get("result", {}).get("state") == "HALT":
+            stack = result.get("result", {}).get("stack", [])
+            if stack and len(stack) > 0:
+                if stack[0].get("type") == "Integer":
+                    price = int(stack[0].get("value", "0"))
+                    if price > 0:
+                        print(f"💰 Current {symbol} price: {price}")
+                    else:
+                        print(f"📝 No price set for {symbol} yet")
                 else:
-                    print("📝 No price set for BTCUSDT yet")
-            else:
-                print("📝 No price data available")
-    else:
-        exception = result.get("result", {}).get("exception", "")
-        print(f"⚠️  Price query returned: {exception}")
+                    print(f"📝 No price data available for {symbol}")
+        else:
+            exception = result.get("result", {}).get("exception", "")
+            print(f"⚠️  {symbol} price query returned: {exception}")
 
 def show_initialization_guide():
     """Show initialization guide"""
@@ -164,7 +175,6 @@ def main():
         
     except Exception as e:
         print(f"\n❌ Error: {e}")
-        import traceback
         traceback.print_exc()
 
 if __name__ == "__main__":
@@ -4,15 +4,36 @@ Direct Neo N3 contract deployment script using Python SDK
 """
 
 import json
-import requests
 import base64
 import time
 from pathlib import Path
 
+from _rpc import create_session, loads_json, post_rpc, rpc_batch
+
 # Configuration
 TESTNET_RPC = "http://seed1t5.neo.org:20332"
 MASTER_WIF = "KzjaqMvqzF1uup6KrTKRxTgjcXE7PbKLRH84e6ckyXDt3fu7afUb"
 MASTER_ADDRESS = "NTmHjwiadq4g3VHpJ5FQigQcD4fF5m8TyX"
+NEF_MAGIC = b"NEF3"
+GAS_ASSET_HASH = "0xd2a4cff31913016155e38e474a2c06d08be276cf"
+DATOSHI_PER_GAS = 100_000_000
+MIN_DEPLOY_DATOSHI = 15 * DATOSHI_PER_GAS
+# Typical system fee of a contract deployment
+DEPLOY_SYSTEM_FEE_DATOSHI = 10 * DATOSHI_PER_GAS
+
+SESSION = create_session()
+
+def post_json(payload):
+    """POST a JSON-RPC payload (single call or batch) and parse the reply"""
+    return post_rpc(SESSION, TESTNET_RPC, payload)
+
+def reply_result(reply):
+    """Result of an RPC reply, or None (after reporting the error)"""
+    if "error" in reply:
+        print(f"❌ RPC Error: {reply['error']}")
+        return None
+    
+    return reply.get("result")
 
 def rpc_call(method, params=None):
     """Make RPC call to Neo N3 TestNet"""
@@ -24,14 +45,7 @@ def rpc_call(method, params=None):
     }
     
     try:
-        response = requests.post(TESTNET_RPC, json=payload, timeout=30)
-        result = response.json()
-        
-        if "error" in result:
-            print(f"❌ RPC Error: {result['error']}")
-            return None
-            
-        return result.get("result")
+        return reply_result(post_json(payload))
     except Exception as e:
         print(f"❌ Network error: {e}")
         return None
@@ -45,28 +59,37 @@ def get_network_fee():
 
 def get_system_fee():
     """Estimate system fee for deployment"""
-    # Typical deployment system fee (in datoshi)
-    return 10_000_000_000  # 10 GAS
+    return DEPLOY_SYSTEM_FEE_DATOSHI
 
 def create_deployment_script(nef_file, manifest_file):
     """Create deployment script"""
     try:
-        # Read NEF file
+        # Read NEF file, checking the magic before loading the rest
         with open(nef_file, 'rb') as f:
+            if f.read(len(NEF_MAGIC)) != NEF_MAGIC:
+                print(f"❌ Not a NEF file: {nef_file}")
+                return None
+            f.seek(0)
             nef_data = f.read()
         
-        # Read manifest
-        with open(manifest_file, 'r') as f:
-            manifest_data = f.read()
+        # Read manifest as raw bytes (exactly as deployed, no newline translation)
+        manifest_bytes = Path(manifest_file).read_bytes()
+        
+        # Reject a malformed manifest here instead of at deployment time
+        try:
+            loads_json(manifest_bytes)
+        except ValueError as e:
+            print(f"❌ Invalid manifest JSON: {e}")
+            return None
         
         print(f"✅ NEF size: {len(nef_data)} bytes")
-        print(f"✅ Manifest size: {len(manifest_data)} bytes")
+        print(f"✅ Manifest size: {len(manifest_bytes)} bytes")
         
         # Create deployment transaction script
         # This is a simplified approach - in practice you'd use neo3-boa
         script_data = {
             "nef": base64.b64encode(nef_data).decode(),
-            "manifest": manifest_data
+            "manifest": manifest_bytes.decode("utf-8")
         }
         
         return script_data
@@ -91,8 +114,18 @@ def check_deployment_requirements():
         print(f"❌ Manifest file not found: {manifest_path}")
         return False
     
+    # Connectivity and balance checks are independent, so send them as one batch
+    try:
+        replies = rpc_batch(post_json, [
+            ("getblockcount", []),
+            ("getnep17balances", [MASTER_ADDRESS])
+        ])
+    except Exception as e:
+        print(f"❌ Network error: {e}")
+        replies = [{}, {}]
+    block_count, balance_result = (reply_result(reply) for reply in replies)
+    
     # Check network connectivity
-    block_count = rpc_call("getblockcount")
     if not block_count:
         print("❌ Cannot connect to TestNet")
         return False
@@ -100,19 +133,17 @@ def check_deployment_requirements():
     print(f"✅ TestNet connected (block {block_count})")
     
     # Check account balance
-    balance_result = rpc_call("getnep17balances", [MASTER_ADDRESS])
     if not balance_result:
         print("❌ Cannot get account balance")
         return False
     
-    gas_balance = 0
-    for balance in balance_result.get("balance", []):
-        if balance["assethash"] == "0xd2a4cff31913016155e38e474a2c06d08be276cf":  # GAS
-            gas_balance = int(balance["amount"]) / 100_000_000
+    # Amounts are fixed-point integers (8 decimals); compare them as integers
+    amounts = {balance["assethash"]: int(balance["amount"]) for balance in balance_result.get("balance", [])}
+    gas_datoshi = amounts.get(GAS_ASSET_HASH, 0)
     
-    print(f"✅ GAS balance: {gas_balance}")
+    print(f"✅ GAS balance: {gas_datoshi / DATOSHI_PER_GAS}")
     
-    if gas_balance < 15:
+    if gas_datoshi < MIN_DEPLOY_DATOSHI:
         print("❌ Insufficient GAS (need at least 15 GAS)")
         return False
     
@@ -135,11 +166,11 @@ def simulate_deployment():
     network_fee = get_network_fee()
     system_fee = get_system_fee()
     
-    total_fee_gas = (network_fee + system_fee) / 100_000_000
+    total_fee_gas = (network_fee + system_fee) / DATOSHI_PER_GAS
     
     print(f"📊 Deployment cost estimate:")
-    print(f"   System fee: ~{system_fee / 100_000_000} GAS")
-    print(f"   Network fee: ~{network_fee / 100_000_000} GAS")
+    print(f"   System fee: ~{system_fee / DATOSHI_PER_GAS} GAS")
+    print(f"   Network fee: ~{network_fee / DATOSHI_PER_GAS} GAS")
     print(f"   Total: ~{total_fee_gas} GAS")
     
     return True
@@ -9,14 +9,9 @@ import requests
 import sys
 import time
 import binascii
-from neo3 import wallet as neo3_wallet
-from neo3.core import types
-from neo3.network.payloads import transaction as tx_module
-from neo3.api.rpc import NeoRpcClient
-from neo3.api import noderpc
-from neo3.contracts import NeoToken, GasToken
-from neo3.core.cryptography import ECPoint
-from neo3.wallet import Account
+
+# neo3 is imported inside the functions that use it, so a missing install is
+# reported by main() instead of failing at import time
 
 # Configuration
 RPC_ENDPOINT = "http://seed1t5.neo.org:20332"
@@ -24,9 +19,13 @@ CONTRACT_HASH = "0x7b75a38c592af6b39d73d0ff971b125b5a55ad0d"
 MASTER_ADDRESS = "NTmHjwiadq4g3VHpJ5FQigQcD4fF5m8TyX"
 MASTER_WIF = "KzjaqMvqzF1uup6KrTKRxTgjcXE7PbKLRH84e6ckyXDt3fu7afUb"
 TEE_ADDRESS = "NiNmXL8FjEUEs1nfX9uHFBNaenxDHJtmuB"
+GAS_ASSET_HASH = "0xd2a4cff31913016155e38e474a2c06d08be276cf"
+DATOSHI_PER_GAS = 100_000_000
 
 def create_and_send_transaction(rpc_client, script, account):
     """Create and send a transaction with the given script."""
+    from neo3.network.payloads import transaction as tx_module
+    
     try:
         # Create transaction
         transaction = tx_module.Transaction()
@@ -97,10 +96,10 @@ def main():
         
         # Check account balance
         balance = rpc_client.get_nep17_balances(account.address)
-        gas_balance = 0
-        for bal in balance:
-            if bal['assethash'] == '0xd2a4cff31913016155e38e474a2c06d08be276cf':  # GAS
-                gas_balance = int(bal['amount']) / 100000000
+        gas_balance = next(
+            (int(bal['amount']) / DATOSHI_PER_GAS for bal in balance if bal['assethash'] == GAS_ASSET_HASH),
+            0
+        )
         
         print(f"💰 GAS Balance: {gas_balance:.8f} GAS")
         
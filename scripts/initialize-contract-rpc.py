@@ -4,50 +4,102 @@ Initialize Neo Price Feed Oracle Contract via RPC
 This script initializes the deployed contract with proper configuration using RPC calls.
 """
 
+import argparse
+import base64
 import json
 import os
-import requests
+import string
 import sys
-import time
-import binascii
+from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from _neo_constants import address_to_script_hash
+from _rpc import create_session, dumps_json, post_rpc, rpc_batch
 
 # Configuration from environment variables
-RPC_ENDPOINT = os.getenv("NEO_RPC_ENDPOINT", "http://seed1t5.neo.org:20332")
+TESTNET_SEEDS = [f"http://seed{i}t5.neo.org:20332" for i in range(1, 5)]
+RPC_ENDPOINT = os.getenv("NEO_RPC_ENDPOINT", TESTNET_SEEDS[0])
+# Read-only calls are raced across the seeds; an explicit endpoint disables the fan-out
+READ_ENDPOINTS = [RPC_ENDPOINT] if "NEO_RPC_ENDPOINT" in os.environ else TESTNET_SEEDS
 CONTRACT_HASH = os.getenv("CONTRACT_SCRIPT_HASH", "0xYOUR_DEPLOYED_CONTRACT_HASH_HERE")
 OWNER_ADDRESS = os.getenv("MASTER_ACCOUNT_ADDRESS", "NTmHjwiadq4g3VHpJ5FQigQcD4fF5m8TyX")
 OWNER_WIF = os.getenv("MASTER_ACCOUNT_PRIVATE_KEY", "KzjaqMvqzF1uup6KrTKRxTgjcXE7PbKLRH84e6ckyXDt3fu7afUb")
 TEE_ADDRESS = os.getenv("TEE_ACCOUNT_ADDRESS", "NiNmXL8FjEUEs1nfX9uHFBNaenxDHJtmuB")
+CONTRACT_NAME = "PriceFeed.Oracle"
 
-def address_to_script_hash(address):
-    """Convert Neo address to script hash (simplified version)."""
-    # For known addresses, return the known script hashes
-    known_addresses = {
-        "NTmHjwiadq4g3VHpJ5FQigQcD4fF5m8TyX": "0x88ac1bdac4c5b67b1b63c95820f088b350df3d91",
-        "NiNmXL8FjEUEs1nfX9uHFBNaenxDHJtmuB": "0xe19de267a37a71734478f6ddaac9c7b77c0c5f8f"
-    }
-    
-    if address in known_addresses:
-        return known_addresses[address]
-    else:
-        # For this script, we only need the known addresses
-        raise ValueError(f"Unknown address: {address}")
+# neo-cli command listing, parsed once at import and filled in by generate_neo_cli_commands()
+_NEO_CLI_COMMANDS_TPL = string.Template("""
+📋 Neo-CLI Commands:
+====================
+Execute these commands in neo-cli to initialize the contract:
 
-def invoke_contract_function(contract_hash, method, params, signers):
-    """Invoke a contract function."""
-    payload = {
-        "jsonrpc": "2.0",
-        "method": "invokefunction",
-        "params": [contract_hash, method, params, signers],
-        "id": 1
-    }
-    
-    response = requests.post(RPC_ENDPOINT, json=payload, timeout=30)
-    result = response.json()
+# Connect to TestNet
+connect $rpc_endpoint
+
+# Import the owner's private key (if not already imported)
+import key $owner_wif
+
+# Initialize the contract
+invoke $contract_hash initialize ["$owner_address","$tee_address"] $owner_address
+
+# Add TEE as oracle
+invoke $contract_hash addOracle ["$tee_address"] $owner_address
+
+# Set minimum oracles to 1
+invoke $contract_hash setMinOracles [1] $owner_address
+
+# Verify the setup
+invokefunction $contract_hash getOwner
+invokefunction $contract_hash getOracles
+invokefunction $contract_hash getMinOracles""")
+
+# Initialization waits on the chain, so it retries longer than the other scripts
+SESSION = create_session(total_retries=5, backoff_factor=0.3)
+
+# Exit codes, so callers can branch without parsing stdout (2 is left to argparse usage errors)
+EXIT_ALREADY_INITIALIZED = 0
+EXIT_ERROR = 1
+EXIT_READY_TO_INITIALIZE = 3
+
+def is_successful_reply(reply):
+    """A single reply wins without an error (on HALT for invocations); a batch wins once no entry has an RPC error."""
+    if isinstance(reply, list):
+        return all("error" not in item for item in reply)
+    if "error" in reply or "result" not in reply:
+        return False
+    # Only invocation results carry a VM state; other results (e.g. getblockcount's int) succeed as-is
+    result = reply["result"]
+    return not isinstance(result, dict) or result.get("state", "HALT") == "HALT"
+
+def race_read_call(payload):
+    """Send a read-only call (or batch) to every read endpoint and return the first successful reply."""
+    # Serialize once, whichever endpoints end up receiving it
+    body = dumps_json(payload)
+    if len(READ_ENDPOINTS) == 1:
+        return post_rpc(SESSION, READ_ENDPOINTS[0], body)
     
-    if "error" in result:
-        raise Exception(f"RPC Error: {result['error']['message']}")
+    executor = ThreadPoolExecutor(max_workers=len(READ_ENDPOINTS))
+    futures = [executor.submit(post_rpc, SESSION, endpoint, body) for endpoint in READ_ENDPOINTS]
+    last_result = None
+    last_error = None
+    try:
+        for future in as_completed(futures):
+            try:
+                result = future.result()
+            except Exception as e:
+                last_error = e
+                continue
+            
+            if is_successful_reply(result):
+                return result
+            last_result = result
+    finally:
+        # Don't wait for the slower seeds once a winner is known
+        executor.shutdown(wait=False, cancel_futures=True)
     
-    return result["result"]
+    if last_result is None:
+        raise last_error
+    return last_result
 
 def send_transaction(script, signers, attributes=None):
     """Create and send a transaction."""
@@ -59,8 +111,7 @@ def send_transaction(script, signers, attributes=None):
         "id": 1
     }
     
-    response = requests.post(RPC_ENDPOINT, json=payload, timeout=30)
-    result = response.json()
+    result = post_rpc(SESSION, RPC_ENDPOINT, payload)
     
     if "error" in result:
         raise Exception(f"RPC Error: {result['error']['message']}")
@@ -78,98 +129,180 @@ def send_transaction(script, signers, attributes=None):
     print("   ℹ️  To complete the transaction, use neo-cli or a wallet to sign and send")
     return result["result"]["script"]
 
+def decode_stack_value(stack_value):
+    """Decode a stack item for display (ByteString/Buffer values are base64-encoded)."""
+    if stack_value["type"] not in ("ByteString", "Buffer"):
+        return stack_value["value"]
+
+    raw = base64.b64decode(stack_value["value"])
+    if len(raw) == 20:
+        # UInt160, shown in its usual big-endian form (checked first, its bytes may all be printable)
+        return "0x" + raw[::-1].hex()
+    if raw and all(32 <= b < 127 for b in raw):
+        return raw.decode('utf-8')
+    return raw.hex()
+
+def decode_hash160(stack_value):
+    """UInt160 string of a ByteString stack item (serialized little-endian), e.g. getOwner's result."""
+    return "0x" + base64.b64decode(stack_value["value"])[::-1].hex()
+
+def reply_value(reply):
+    """Decoded first stack item of an invokefunction reply, or None if the call failed."""
+    result = reply.get("result")
+    if result is None or result["state"] != "HALT" or not result["stack"]:
+        return None
+    return decode_stack_value(result["stack"][0])
+
+def fetch_contract_state():
+    """Read the owner and oracle setup from the node, or None if getOwner did not HALT."""
+    # Deployment, owner and oracle setup in one round trip
+    tee_param = {"type": "Hash160", "value": address_to_script_hash(TEE_ADDRESS)}
+    state_reply, owner_reply, count_reply, is_oracle_reply, min_reply = rpc_batch(race_read_call, [
+        ("getcontractstate", [CONTRACT_HASH]),
+        ("invokefunction", [CONTRACT_HASH, "getOwner", []]),
+        ("invokefunction", [CONTRACT_HASH, "getOracleCount", []]),
+        ("invokefunction", [CONTRACT_HASH, "isOracle", [tee_param]]),
+        ("invokefunction", [CONTRACT_HASH, "getMinOracles", []])
+    ])
+    
+    if "error" in state_reply:
+        raise Exception(f"Contract not deployed: {state_reply['error']['message']}")
+    contract_name = state_reply.get("result", {}).get("manifest", {}).get("name")
+    if contract_name != CONTRACT_NAME:
+        raise Exception(f"Unexpected contract at {CONTRACT_HASH}: {contract_name}")
+    
+    if "error" in owner_reply:
+        raise Exception(f"RPC Error: {owner_reply['error']['message']}")
+    
+    result = owner_reply.get("result")
+    if result is None or result["state"] != "HALT" or not result["stack"]:
+        return None
+    
+    stack_value = result["stack"][0]
+    return {
+        "owner": decode_hash160(stack_value) if stack_value["type"] != "Any" else None,
+        "oracle_count": reply_value(count_reply),
+        "tee_is_oracle": reply_value(is_oracle_reply),
+        "min_oracles": reply_value(min_reply)
+    }
+
 def check_contract_state():
     """Check if the contract is initialized."""
     print("🔍 Checking contract state...")
     
-    # Check owner
-    result = invoke_contract_function(CONTRACT_HASH, "getOwner", [], [])
-    if result["state"] == "HALT" and result["stack"]:
-        stack_value = result["stack"][0]
-        if stack_value["type"] != "Any":
-            owner_hex = stack_value["value"]
-            owner_address = binascii.unhexlify(owner_hex).decode('utf-8')
-            print(f"   ✅ Owner: {owner_address}")
-            return True
-        else:
-            print("   ❌ Owner: Not set (contract not initialized)")
-            return False
-    else:
+    state = fetch_contract_state()
+    if state is None:
         print("   ❌ Failed to get owner")
         return False
-
-def generate_initialization_script():
-    """Generate the initialization script."""
-    print("\n📝 Generating initialization commands...")
     
+    if state["owner"] is None:
+        print("   ❌ Owner: Not set (contract not initialized)")
+        return False
+    
+    print(f"   ✅ Owner: {state['owner']}")
+    print(f"   ℹ️  Oracle count: {state['oracle_count']}")
+    print(f"   ℹ️  TEE account is oracle: {state['tee_is_oracle']}")
+    print(f"   ℹ️  Minimum oracles: {state['min_oracles']}")
+    return True
+
+@dataclass
+class PreparedCall:
+    """A contract call that is previewed once and reused for display."""
+    label: str
+    method: str
+    params: list
+    signers: list
+    state: str = None
+    script: str = None
+    gas: str = None
+    error: str = None
+
+def prepare_initialization_calls():
+    """Build the initialization calls plus the post-initialization verification reads."""
     owner_signer = {
         "account": address_to_script_hash(OWNER_ADDRESS),
         "scopes": "CalledByEntry"
     }
-    
-    # Initialize contract
-    print("\n1️⃣ Initialize contract command:")
     init_params = [
         {"type": "String", "value": OWNER_ADDRESS},
         {"type": "String", "value": TEE_ADDRESS}
     ]
-    init_result = invoke_contract_function(CONTRACT_HASH, "initialize", init_params, [owner_signer])
-    
-    if init_result["state"] == "HALT":
-        print(f"   Script: {init_result['script']}")
-        print(f"   GAS consumed: {init_result['gasconsumed']}")
-    
-    # Add oracle
-    print("\n2️⃣ Add oracle command:")
     oracle_params = [{"type": "String", "value": TEE_ADDRESS}]
-    oracle_result = invoke_contract_function(CONTRACT_HASH, "addOracle", oracle_params, [owner_signer])
-    
-    if oracle_result["state"] == "HALT":
-        print(f"   Script: {oracle_result['script']}")
-        print(f"   GAS consumed: {oracle_result['gasconsumed']}")
-    
-    # Set min oracles
-    print("\n3️⃣ Set minimum oracles command:")
     min_params = [{"type": "Integer", "value": "1"}]
-    min_result = invoke_contract_function(CONTRACT_HASH, "setMinOracles", min_params, [owner_signer])
     
-    if min_result["state"] == "HALT":
-        print(f"   Script: {min_result['script']}")
-        print(f"   GAS consumed: {min_result['gasconsumed']}")
+    return [
+        PreparedCall("1️⃣ Initialize contract command:", "initialize", init_params, [owner_signer]),
+        PreparedCall("2️⃣ Add oracle command:", "addOracle", oracle_params, [owner_signer]),
+        PreparedCall("3️⃣ Set minimum oracles command:", "setMinOracles", min_params, [owner_signer]),
+        PreparedCall("🔍 Verify owner:", "getOwner", [], []),
+        PreparedCall("🔍 Verify oracles:", "getOracles", [], []),
+        PreparedCall("🔍 Verify minimum oracles:", "getMinOracles", [], [])
+    ]
 
-def generate_neo_cli_commands():
-    """Generate neo-cli commands for manual execution."""
-    print("\n📋 Neo-CLI Commands:")
-    print("====================")
-    print("Execute these commands in neo-cli to initialize the contract:\n")
+def preview_calls(calls):
+    """Preview all calls in a single JSON-RPC batch and cache the results on each call."""
+    replies = rpc_batch(race_read_call, [
+        ("invokefunction", [CONTRACT_HASH, call.method, call.params, call.signers])
+        for call in calls
+    ])
     
-    print(f"# Connect to TestNet")
-    print(f"connect {RPC_ENDPOINT}")
-    print()
-    
-    print(f"# Import the owner's private key (if not already imported)")
-    print(f"import key {OWNER_WIF}")
-    print()
-    
-    print(f"# Initialize the contract")
-    print(f'invoke {CONTRACT_HASH} initialize ["{OWNER_ADDRESS}","{TEE_ADDRESS}"] {OWNER_ADDRESS}')
-    print()
-    
-    print(f"# Add TEE as oracle")
-    print(f'invoke {CONTRACT_HASH} addOracle ["{TEE_ADDRESS}"] {OWNER_ADDRESS}')
-    print()
+    for call, reply in zip(calls, replies):
+        if "error" in reply:
+            call.error = reply["error"]["message"]
+            continue
+        
+        result = reply.get("result")
+        if result is None:
+            call.error = "No result in reply"
+            continue
+        
+        call.state = result["state"]
+        call.script = result.get("script")
+        call.gas = result.get("gasconsumed")
+        call.error = result.get("exception")
+
+def generate_initialization_script():
+    """Generate the initialization script."""
+    print("\n📝 Generating initialization commands...")
     
-    print(f"# Set minimum oracles to 1")
-    print(f'invoke {CONTRACT_HASH} setMinOracles [1] {OWNER_ADDRESS}')
-    print()
+    calls = prepare_initialization_calls()
+    preview_calls(calls)
     
-    print(f"# Verify the setup")
-    print(f"invokefunction {CONTRACT_HASH} getOwner")
-    print(f"invokefunction {CONTRACT_HASH} getOracles")
-    print(f"invokefunction {CONTRACT_HASH} getMinOracles")
+    for call in calls:
+        print(f"\n{call.label}")
+        if call.state == "HALT":
+            print(f"   Script: {call.script}")
+            print(f"   GAS consumed: {call.gas}")
+        else:
+            print(f"   ❌ {call.method} preview failed: {call.error}")
+
+def generate_neo_cli_commands():
+    """Generate neo-cli commands for manual execution."""
+    print(_NEO_CLI_COMMANDS_TPL.substitute(
+        rpc_endpoint=RPC_ENDPOINT,
+        owner_wif=OWNER_WIF,
+        contract_hash=CONTRACT_HASH,
+        owner_address=OWNER_ADDRESS,
+        tee_address=TEE_ADDRESS
+    ))
+
+def parse_args():
+    """Parse command line options."""
+    parser = argparse.ArgumentParser(
+        description="Prepare initialization of the Neo Price Feed Oracle contract.",
+        epilog=f"Exit codes: {EXIT_ALREADY_INITIALIZED} already initialized, {EXIT_ERROR} error, "
+               f"2 usage error, {EXIT_READY_TO_INITIALIZE} ready to initialize."
+    )
+    parser.add_argument("-y", "--yes", action="store_true", default=not sys.stdin.isatty(),
+                        help="Show initialization commands without prompting (default when stdin is not a terminal)")
+    parser.add_argument("--quiet", action="store_true",
+                        help="Only report the contract state; skip generating initialization commands")
+    return parser.parse_args()
 
 def main():
     """Main function."""
+    args = parse_args()
+    
     print("🚀 Neo Price Feed Oracle Contract Initialization")
     print("================================================")
     print(f"Contract: {CONTRACT_HASH}")
@@ -178,13 +311,24 @@ def main():
     print()
     
     # Check current state
-    is_initialized = check_contract_state()
+    try:
+        is_initialized = check_contract_state()
+    except Exception as e:
+        print(f"\n❌ Error checking contract state: {e}")
+        return EXIT_ERROR
+    
+    exit_code = EXIT_ALREADY_INITIALIZED if is_initialized else EXIT_READY_TO_INITIALIZE
     
     if is_initialized:
         print("\n✅ Contract appears to be already initialized!")
-        response = input("Do you want to see the initialization commands anyway? (y/n): ")
-        if response.lower() != 'y':
-            return
+        if args.quiet:
+            return exit_code
+        if not args.yes:
+            response = input("Do you want to see the initialization commands anyway? (y/n): ")
+            if response.lower() != 'y':
+                return exit_code
+    elif args.quiet:
+        return exit_code
     
     # Generate initialization script
     try:
@@ -199,6 +343,8 @@ def main():
     print("1. Use neo-cli with the commands above to initialize the contract")
     print("2. Or use a Neo wallet that supports contract invocation")
     print("3. After initialization, run the verification script to confirm")
+    
+    return exit_code
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -3,10 +3,14 @@
 Initialize deployed contract with admin accounts and settings
 """
 
-import json
 import sys
 from pathlib import Path
 
+from _rpc import loads_json
+
+# Placeholder hash shipped in appsettings.json, compared as raw bytes so case and the 0x prefix don't matter
+PLACEHOLDER_CONTRACT_HASH = bytes.fromhex("245f20c5932eb9c5db16b66b9d074b40ee12be50")
+
 def load_config():
     """Load configuration to get contract hash"""
     config_path = Path("src/PriceFeed.Console/appsettings.json")
@@ -16,12 +20,11 @@ def load_config():
         return None
     
     try:
-        with open(config_path, 'r') as f:
-            config = json.load(f)
+        config = loads_json(config_path.read_bytes())
         
         contract_hash = config.get("BatchProcessing", {}).get("ContractScriptHash", "")
         
-        if not contract_hash or contract_hash == "0x245f20c5932eb9c5db16b66b9d074b40ee12be50":
+        if not contract_hash or bytes.fromhex(contract_hash.removeprefix("0x")) == PLACEHOLDER_CONTRACT_HASH:
             print("❌ Contract hash not updated in configuration")
             print("   Please run: python3 scripts/update-contract-hash.py YOUR_CONTRACT_HASH")
             return None
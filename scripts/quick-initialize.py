@@ -7,27 +7,32 @@ import requests
 import json
 import sys
 
+from _rpc import create_session, post_rpc, rpc_batch
+
 # Configuration
 RPC_ENDPOINT = "http://seed1t5.neo.org:20332"
 CONTRACT_HASH = "0x7b75a38c592af6b39d73d0ff971b125b5a55ad0d"
 MASTER_ADDRESS = "NTmHjwiadq4g3VHpJ5FQigQcD4fF5m8TyX"
 TEE_ADDRESS = "NiNmXL8FjEUEs1nfX9uHFBNaenxDHJtmuB"
 
-def check_contract_state():
+# One keep-alive connection to the RPC node, reused by every call
+SESSION = create_session()
+
+def rpc_post(payload):
+    """POST a JSON-RPC payload (single call or batch) and parse the reply"""
+    return post_rpc(SESSION, RPC_ENDPOINT, payload)
+
+def fetch_contract_replies():
+    """Fetch the contract state and its owner in one batched request"""
+    return rpc_batch(rpc_post, [
+        ("getcontractstate", [CONTRACT_HASH]),
+        ("invokefunction", [CONTRACT_HASH, "getOwner", []])
+    ])
+
+def check_contract_state(result):
     """Check current contract state"""
     print("🔍 Checking contract state...")
     
-    # Check if contract exists
-    payload = {
-        "jsonrpc": "2.0",
-        "method": "getcontractstate",
-        "params": [CONTRACT_HASH],
-        "id": 1
-    }
-    
-    response = requests.post(RPC_ENDPOINT, json=payload)
-    result = response.json()
-    
     if 'result' in result:
         print(f"✅ Contract found at: {CONTRACT_HASH}")
         return True
@@ -35,21 +40,10 @@ def check_contract_state():
         print(f"❌ Contract not found at: {CONTRACT_HASH}")
         return False
 
-def check_initialization():
+def check_initialization(result):
     """Check if contract is initialized"""
     print("\n🔍 Checking initialization status...")
     
-    # Invoke getOwner
-    payload = {
-        "jsonrpc": "2.0",
-        "method": "invokefunction",
-        "params": [CONTRACT_HASH, "getOwner", []],
-        "id": 1
-    }
-    
-    response = requests.post(RPC_ENDPOINT, json=payload)
-    result = response.json()
-    
     if result.get('result', {}).get('stack', []):
         stack_value = result['result']['stack'][0]
         if stack_value.get('type') != 'Any' or stack_value.get('value'):
@@ -63,12 +57,19 @@ def main():
     print("🚀 Neo Price Feed Contract Initialization")
     print("=" * 50)
     
+    try:
+        state_reply, owner_reply = fetch_contract_replies()
+    except (requests.RequestException, ValueError) as e:
+        # Connection failures and non-JSON replies from the node
+        print(f"❌ RPC request failed: {e}")
+        sys.exit(1)
+    
     # Check contract exists
-    if not check_contract_state():
+    if not check_contract_state(state_reply):
         sys.exit(1)
     
     # Check initialization
-    if check_initialization():
+    if check_initialization(owner_reply):
         print("\n✅ Contract is ready to use!")
         return
     
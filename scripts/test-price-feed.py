@@ -13,9 +13,13 @@ import os
 import requests
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import base64
 
+from _neo_constants import address_to_script_hash
+from _rpc import create_session, loads_json, post_rpc, rpc_batch
+
 # Configuration from environment variables
 RPC_ENDPOINT = os.getenv("NEO_RPC_ENDPOINT", "http://seed1t5.neo.org:20332")
 CONTRACT_HASH = os.getenv("CONTRACT_SCRIPT_HASH", "0xYOUR_DEPLOYED_CONTRACT_HASH_HERE")
@@ -38,6 +42,19 @@ PRICE_SOURCES = {
     }
 }
 
+# Response keys of each source, mapped to the symbols reported in the results
+COINGECKO_IDS = {"bitcoin": "BTC", "ethereum": "ETH", "neo": "NEO"}
+KRAKEN_BTC_PAIR = "XXBTZUSD"  # required
+KRAKEN_PAIRS = {"XETHZUSD": "ETH"}  # optional, reported as 0 when missing
+
+# Shared by the RPC calls and the price source checks, so connections are kept alive
+# between requests. requests already asks for gzip/deflate responses and decodes them.
+SESSION = create_session()
+
+def rpc_post(payload):
+    """POST a JSON-RPC payload (single call or batch) and parse the reply."""
+    return post_rpc(SESSION, RPC_ENDPOINT, payload, timeout=10)
+
 def test_price_sources():
     """Test if price sources are accessible and returning data."""
     print("🌐 Testing Price Sources")
@@ -45,26 +62,28 @@ def test_price_sources():
     
     results = {}
     
+    # The sources are independent, so fetch them all at once and parse in order
+    with ThreadPoolExecutor(max_workers=len(PRICE_SOURCES)) as executor:
+        responses = {
+            name: executor.submit(SESSION.get, source["url"], params=source["params"], timeout=10)
+            for name, source in PRICE_SOURCES.items()
+        }
+    
     # Test CoinGecko
     print("\n1. CoinGecko:")
     try:
-        response = requests.get(PRICE_SOURCES["CoinGecko"]["url"], 
-                              params=PRICE_SOURCES["CoinGecko"]["params"], 
-                              timeout=10)
+        response = responses["CoinGecko"].result()
         if response.status_code == 200:
-            data = response.json()
-            btc_price = data.get("bitcoin", {}).get("usd", 0)
-            eth_price = data.get("ethereum", {}).get("usd", 0)
-            neo_price = data.get("neo", {}).get("usd", 0)
+            data = loads_json(response.content)
+            prices = {symbol: data.get(coin, {}).get("usd", 0) for coin, symbol in COINGECKO_IDS.items()}
             
             print(f"   ✅ Accessible")
-            print(f"   BTC: ${btc_price:,.2f}")
-            print(f"   ETH: ${eth_price:,.2f}")
-            print(f"   NEO: ${neo_price:,.2f}")
+            for symbol, price in prices.items():
+                print(f"   {symbol}: ${price:,.2f}")
             
             results["CoinGecko"] = {
                 "status": "OK",
-                "prices": {"BTC": btc_price, "ETH": eth_price, "NEO": neo_price}
+                "prices": prices
             }
         else:
             print(f"   ❌ HTTP {response.status_code}")
@@ -76,23 +95,26 @@ def test_price_sources():
     # Test Kraken
     print("\n2. Kraken:")
     try:
-        response = requests.get(PRICE_SOURCES["Kraken"]["url"], 
-                              params=PRICE_SOURCES["Kraken"]["params"], 
-                              timeout=10)
+        response = responses["Kraken"].result()
         if response.status_code == 200:
-            data = response.json()
+            data = loads_json(response.content)
             if data.get("error") == []:
-                btc_price = float(data["result"]["XXBTZUSD"]["c"][0])
-                eth_price = float(data["result"]["XETHZUSD"]["c"][0]) if "XETHZUSD" in data["result"] else 0
+                tickers = data["result"]
+                # The last trade price is the first element of "c". A missing BTC ticker
+                # raises KeyError, which reports the source as an error below
+                prices = {"BTC": float(tickers[KRAKEN_BTC_PAIR]["c"][0])}
+                for pair, symbol in KRAKEN_PAIRS.items():
+                    ticker = tickers.get(pair)
+                    prices[symbol] = float(ticker["c"][0]) if ticker else 0
                 
                 print(f"   ✅ Accessible")
-                print(f"   BTC: ${btc_price:,.2f}")
-                if eth_price > 0:
-                    print(f"   ETH: ${eth_price:,.2f}")
+                for symbol, price in prices.items():
+                    if price > 0:
+                        print(f"   {symbol}: ${price:,.2f}")
                 
                 results["Kraken"] = {
                     "status": "OK",
-                    "prices": {"BTC": btc_price, "ETH": eth_price}
+                    "prices": prices
                 }
             else:
                 print(f"   ❌ API Error: {data['error']}")
@@ -107,11 +129,9 @@ def test_price_sources():
     # Test Coinbase
     print("\n3. Coinbase:")
     try:
-        response = requests.get(PRICE_SOURCES["Coinbase"]["url"], 
-                              params=PRICE_SOURCES["Coinbase"]["params"], 
-                              timeout=10)
+        response = responses["Coinbase"].result()
         if response.status_code == 200:
-            data = response.json()
+            data = loads_json(response.content)
             rates = data.get("data", {}).get("rates", {})
             
             # Coinbase gives inverse rates (USD to crypto)
@@ -138,18 +158,32 @@ def test_price_sources():
     
     return results
 
+def stack_bytes(item):
+    """Raw bytes of a ByteString/Buffer stack item (Neo N3 RPC returns them base64-encoded)."""
+    return base64.b64decode(item["value"])
+
+def stack_hash160(item):
+    """UInt160 string (0x-prefixed, big-endian) of a 20-byte stack item, e.g. an account."""
+    return "0x" + stack_bytes(item)[::-1].hex()
+
 def test_contract_methods():
-    """Test contract method calls."""
+    """Test contract method calls and return the getOwner result for check_system_health()."""
     print("\n📝 Testing Contract Methods")
     print("===========================")
     
+    # All reads go out in a single batched request
+    test_symbols = ["BTCUSDT", "ETHUSDT", "NEOUSDT"]
+    calls = [("getOwner", []), ("getOracles", []), ("getMinOracles", [])]
+    calls += [("getPriceData", [{"type": "String", "value": symbol}]) for symbol in test_symbols]
+    owner_result, oracles_result, min_oracles_result, *price_results = invoke_contract_methods(calls)
+    
     # Test getOwner
     print("\n1. getOwner():")
-    result = invoke_contract_method("getOwner", [])
+    result = owner_result
     if result and result["state"] == "HALT":
         stack = result.get("stack", [])
         if stack and stack[0]["type"] != "Any":
-            owner = bytes.fromhex(stack[0]["value"]).decode('utf-8')
+            owner = stack_hash160(stack[0])
             print(f"   ✅ Owner: {owner}")
         else:
             print("   ❌ Owner not set (contract not initialized)")
@@ -158,14 +192,14 @@ def test_contract_methods():
     
     # Test getOracles
     print("\n2. getOracles():")
-    result = invoke_contract_method("getOracles", [])
+    result = oracles_result
     if result and result["state"] == "HALT":
         stack = result.get("stack", [])
         if stack and stack[0]["type"] == "Array":
             oracles = stack[0]["value"]
             print(f"   ✅ Oracles: {len(oracles)} configured")
             for oracle in oracles:
-                oracle_addr = bytes.fromhex(oracle["value"]).decode('utf-8')
+                oracle_addr = stack_hash160(oracle)
                 print(f"      - {oracle_addr}")
         else:
             print("   ❌ No oracles configured")
@@ -174,7 +208,7 @@ def test_contract_methods():
     
     # Test getMinOracles
     print("\n3. getMinOracles():")
-    result = invoke_contract_method("getMinOracles", [])
+    result = min_oracles_result
     if result and result["state"] == "HALT":
         stack = result.get("stack", [])
         if stack and stack[0]["type"] == "Integer":
@@ -187,22 +221,20 @@ def test_contract_methods():
     
     # Test getPriceData for multiple symbols
     print("\n4. getPriceData(symbol):")
-    test_symbols = ["BTCUSDT", "ETHUSDT", "NEOUSDT"]
-    for symbol in test_symbols:
-        result = invoke_contract_method("getPriceData", [{"type": "String", "value": symbol}])
+    now = time.time()
+    for symbol, result in zip(test_symbols, price_results):
         if result and result["state"] == "HALT":
             stack = result.get("stack", [])
             if stack and stack[0]["type"] == "Struct":
                 data = stack[0]["value"]
                 if len(data) >= 4:
-                    stored_symbol = bytes.fromhex(data[0]["value"]).decode('utf-8')
+                    stored_symbol = stack_bytes(data[0]).decode('utf-8')
                     price = int(data[1]["value"])
                     timestamp = int(data[2]["value"])
                     confidence = int(data[3]["value"])
                     
                     price_decimal = price / 100000000
-                    update_time = datetime.fromtimestamp(timestamp / 1000)
-                    age_seconds = (datetime.now() - update_time).total_seconds()
+                    age_seconds = now - timestamp / 1000
                     
                     print(f"   ✅ {symbol}: ${price_decimal:.2f}")
                     print(f"      Updated: {int(age_seconds)}s ago")
@@ -213,26 +245,19 @@ def test_contract_methods():
                 print(f"   ❌ {symbol}: No data")
         else:
             print(f"   ❌ {symbol}: Method call failed")
-
-def invoke_contract_method(method, params):
-    """Invoke a contract method and return the result."""
-    payload = {
-        "jsonrpc": "2.0",
-        "method": "invokefunction",
-        "params": [CONTRACT_HASH, method, params],
-        "id": 1
-    }
     
+    return owner_result
+
+def invoke_contract_methods(calls):
+    """Invoke several (method, params) calls in one batched request; results are in call order."""
     try:
-        response = requests.post(RPC_ENDPOINT, json=payload, timeout=10)
-        result = response.json()
-        
-        if "error" in result:
-            return None
-        
-        return result["result"]
-    except:
-        return None
+        replies = rpc_batch(rpc_post, [("invokefunction", [CONTRACT_HASH, method, params]) for method, params in calls])
+    except (requests.RequestException, ValueError):
+        # Connection failures and non-JSON replies leave every result as None
+        return [None] * len(calls)
+    
+    # Error replies (including calls missing from the batch) give None
+    return [reply.get("result") for reply in replies]
 
 def simulate_price_update():
     """Simulate a price update transaction."""
@@ -280,7 +305,7 @@ def simulate_price_update():
     # Test the updatePriceBatch call
     print("\nTesting updatePriceBatch script generation...")
     signers = [{
-        "account": "0xe19de267a37a71734478f6ddaac9c7b77c0c5f8f",  # TEE account script hash
+        "account": address_to_script_hash(TEE_ADDRESS),
         "scopes": "CalledByEntry"
     }]
     
@@ -292,8 +317,7 @@ def simulate_price_update():
     }
     
     try:
-        response = requests.post(RPC_ENDPOINT, json=payload, timeout=10)
-        result = response.json()
+        result = rpc_post(payload)
         
         if "error" in result:
             print(f"❌ Error: {result['error']['message']}")
@@ -316,8 +340,8 @@ def simulate_price_update():
     except Exception as e:
         print(f"❌ Error: {str(e)}")
 
-def check_system_health():
-    """Overall system health check."""
+def check_system_health(sources, owner_result):
+    """Overall system health check, using the results of test_price_sources() and test_contract_methods()."""
     print("\n🏥 System Health Check")
     print("======================")
     
@@ -337,22 +361,19 @@ def check_system_health():
             "params": [CONTRACT_HASH],
             "id": 1
         }
-        response = requests.post(RPC_ENDPOINT, json=payload, timeout=10)
-        result = response.json()
+        result = rpc_post(payload)
         if "result" in result:
             health_status["contract_deployed"] = True
     except:
         pass
     
     # Check initialization
-    owner_result = invoke_contract_method("getOwner", [])
     if owner_result and owner_result["state"] == "HALT":
         stack = owner_result.get("stack", [])
         if stack and stack[0]["type"] != "Any":
             health_status["contract_initialized"] = True
     
     # Check price sources (at least 2 working)
-    sources = test_price_sources()
     working_sources = sum(1 for s in sources.values() if s["status"] == "OK")
     health_status["price_sources_available"] = working_sources >= 2
     
@@ -391,8 +412,9 @@ def main():
     print()
     
     # Run all tests
-    test_contract_methods()
-    health_status = check_system_health()
+    owner_result = test_contract_methods()
+    sources = test_price_sources()
+    health_status = check_system_health(sources, owner_result)
     
     if health_status["contract_initialized"]:
         simulate_price_update()
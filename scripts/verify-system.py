@@ -4,39 +4,59 @@ Verify Neo Price Feed Oracle System
 This script checks the complete system to ensure everything is working correctly.
 """
 
+import base64
 import json
-import requests
+import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
+from _neo_constants import address_to_script_hash
+from _rpc import create_session, post_rpc, rpc_batch
+
 # Configuration
 RPC_ENDPOINT = "http://seed1t5.neo.org:20332"
 CONTRACT_HASH = "0x7b75a38c592af6b39d73d0ff971b125b5a55ad0d"
 TEE_ADDRESS = "NiNmXL8FjEUEs1nfX9uHFBNaenxDHJtmuB"
 OWNER_ADDRESS = "NTmHjwiadq4g3VHpJ5FQigQcD4fF5m8TyX"
+TEE_SCRIPT_HASH = address_to_script_hash(TEE_ADDRESS)
+# Schedule expression of each "cron:" entry in a workflow, quoted or not, ignoring a trailing comment
+CRON_PATTERN = re.compile(r"""cron:\s*["']?([^"'#\n]+?)["']?\s*(?:#.*)?$""", re.MULTILINE)
 
-def invoke_contract_method(method, params=[]):
-    """Invoke a contract method and return the result."""
-    payload = {
-        "jsonrpc": "2.0",
-        "method": "invokefunction",
-        "params": [CONTRACT_HASH, method, params],
-        "id": 1
-    }
-    
+SESSION = create_session()
+
+def rpc_post(payload):
+    """POST a JSON-RPC payload (single call or batch) and parse the reply."""
+    return post_rpc(SESSION, RPC_ENDPOINT, payload, timeout=10)
+
+def batch_replies(calls):
+    """Replies to several (method, params) RPC calls in call order; a failed request fails every call."""
     try:
-        response = requests.post(RPC_ENDPOINT, json=payload, timeout=10)
-        result = response.json()
-        
-        if "error" in result:
-            return None, result["error"]["message"]
-        
-        if result["result"]["state"] == "HALT":
-            return result["result"]["stack"], None
-        else:
-            return None, f"Execution failed: {result['result']['exception']}"
+        return rpc_batch(rpc_post, calls)
     except Exception as e:
-        return None, str(e)
+        return [{"error": {"message": str(e)}}] * len(calls)
+
+def invoke_result(reply):
+    """Return (stack, error) for an invokefunction reply."""
+    if "error" in reply:
+        return None, reply["error"]["message"]
+    
+    result = reply.get("result")
+    if result is None:
+        return None, "No result in reply"
+    
+    if result["state"] == "HALT":
+        return result["stack"], None
+    else:
+        return None, f"Execution failed: {result.get('exception')}"
+
+def hash160_string(value):
+    """UInt160 string of a base64 ByteString account value (serialized little-endian)."""
+    return "0x" + base64.b64decode(value, validate=True)[::-1].hex()
+
+def stack_accounts(stack_item):
+    """UInt160 strings of an Array stack item of accounts."""
+    return [hash160_string(item["value"]) for item in stack_item["value"]]
 
 def check_contract_deployment():
     """Check if the contract is deployed."""
@@ -50,8 +70,7 @@ def check_contract_deployment():
     }
     
     try:
-        response = requests.post(RPC_ENDPOINT, json=payload, timeout=10)
-        result = response.json()
+        result = rpc_post(payload)
         
         if "error" in result:
             print("   ❌ Contract not found on TestNet")
@@ -68,8 +87,13 @@ def check_contract_initialization():
     """Check if the contract is initialized."""
     print("\n2. Checking contract initialization...")
     
+    # Fetch all four settings in one round trip
+    methods = ("getOwner", "getTeeAccounts", "getOracles", "getMinOracles")
+    replies = batch_replies([("invokefunction", [CONTRACT_HASH, method, []]) for method in methods])
+    owner_call, tee_call, oracles_call, min_oracles_call = (invoke_result(reply) for reply in replies)
+    
     # Check owner
-    stack, error = invoke_contract_method("getOwner")
+    stack, error = owner_call
     if error:
         print(f"   ❌ Error getting owner: {error}")
         return False
@@ -78,25 +102,22 @@ def check_contract_initialization():
         print("   ❌ Contract not initialized (no owner set)")
         return False
     
-    try:
-        # Handle different stack response formats
-        if isinstance(stack[0], dict) and "value" in stack[0]:
-            owner_value = stack[0]["value"]
-        else:
-            owner_value = stack[0]
-        
-        if not owner_value:
-            print("   ❌ Contract not initialized (no owner set)")
-            return False
-            
-        owner = bytes.fromhex(owner_value).decode('utf-8')
-    except:
+    # Handle different stack response formats
+    owner_value = stack[0].get("value") if isinstance(stack[0], dict) else stack[0]
+    if not owner_value:
         print("   ❌ Contract not initialized (no owner set)")
         return False
+    
+    try:
+        owner = hash160_string(owner_value)
+    except (TypeError, ValueError):
+        # binascii.Error (bad base64) is a ValueError
+        print(f"   ❌ Unexpected owner value: {owner_value!r}")
+        return False
     print(f"   ✅ Owner: {owner}")
     
     # Check TEE accounts
-    stack, error = invoke_contract_method("getTeeAccounts")
+    stack, error = tee_call
     if error:
         print(f"   ❌ Error getting TEE accounts: {error}")
         return False
@@ -105,11 +126,11 @@ def check_contract_initialization():
         print("   ❌ No TEE accounts configured")
         return False
     
-    tee_accounts = [bytes.fromhex(item["value"]).decode('utf-8') for item in stack[0]["value"]]
+    tee_accounts = stack_accounts(stack[0])
     print(f"   ✅ TEE accounts: {tee_accounts}")
     
     # Check oracles
-    stack, error = invoke_contract_method("getOracles")
+    stack, error = oracles_call
     if error:
         print(f"   ❌ Error getting oracles: {error}")
         return False
@@ -118,11 +139,11 @@ def check_contract_initialization():
         print("   ❌ No oracles configured")
         return False
     
-    oracles = [bytes.fromhex(item["value"]).decode('utf-8') for item in stack[0]["value"]]
+    oracles = stack_accounts(stack[0])
     print(f"   ✅ Oracles: {oracles}")
     
     # Check min oracles
-    stack, error = invoke_contract_method("getMinOracles")
+    stack, error = min_oracles_call
     if error:
         print(f"   ❌ Error getting min oracles: {error}")
         return False
@@ -130,7 +151,7 @@ def check_contract_initialization():
     min_oracles = int(stack[0]["value"]) if stack and stack[0]["value"] else 0
     print(f"   ✅ Minimum oracles: {min_oracles}")
     
-    return TEE_ADDRESS in tee_accounts and TEE_ADDRESS in oracles and min_oracles > 0
+    return TEE_SCRIPT_HASH in tee_accounts and TEE_SCRIPT_HASH in oracles and min_oracles > 0
 
 def check_price_data():
     """Check if price data is available in the contract."""
@@ -139,8 +160,14 @@ def check_price_data():
     test_symbols = ["BTCUSDT", "ETHUSDT", "NEOUSDT"]
     has_data = False
     
-    for symbol in test_symbols:
-        stack, error = invoke_contract_method("getPriceData", [{"type": "String", "value": symbol}])
+    # One batched request for every symbol; a failing symbol does not affect the others
+    replies = batch_replies([
+        ("invokefunction", [CONTRACT_HASH, "getPriceData", [{"type": "String", "value": symbol}]])
+        for symbol in test_symbols
+    ])
+    
+    for symbol, reply in zip(test_symbols, replies):
+        stack, error = invoke_result(reply)
         
         if error or not stack or not stack[0]["value"]:
             print(f"   ⚠️  No price data for {symbol}")
@@ -150,7 +177,7 @@ def check_price_data():
             # Parse the struct returned by getPriceData
             data = stack[0]["value"]
             if len(data) >= 4:
-                stored_symbol = bytes.fromhex(data[0]["value"]).decode('utf-8')
+                stored_symbol = base64.b64decode(data[0]["value"]).decode('utf-8')
                 price = int(data[1]["value"]) / 100_000_000
                 timestamp = int(data[2]["value"])
                 confidence = int(data[3]["value"])
@@ -180,9 +207,8 @@ def check_github_actions():
             print("   ✅ GitHub Actions workflow configured with schedule")
             
             # Extract cron schedule
-            for line in workflow.split('\n'):
-                if 'cron:' in line:
-                    print(f"      Schedule: {line.strip()}")
+            for schedule in CRON_PATTERN.findall(workflow):
+                print(f"      Schedule: {schedule}")
             
             return True
         else:
@@ -204,9 +230,13 @@ def check_price_sources():
     
     working_sources = 0
     
-    for name, url in sources.items():
+    # Probe all sources at once so one slow API does not hold up the others
+    with ThreadPoolExecutor(max_workers=len(sources)) as executor:
+        futures = {name: executor.submit(SESSION.get, url, timeout=5) for name, url in sources.items()}
+    
+    for name, future in futures.items():
         try:
-            response = requests.get(url, timeout=5)
+            response = future.result()
             if response.status_code == 200:
                 print(f"   ✅ {name}: Accessible")
                 working_sources += 1